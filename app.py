@@ -1,8 +1,82 @@
 import streamlit as st
-import subprocess
+from datetime import datetime
 
 st.set_page_config(page_title="Automation of Calendar Sync", layout="wide")
 
+
+def _run(args):
+    """Runs a command without a shell and returns its combined output."""
+    # Imported lazily: only the Cron Status tab needs them
+    import shutil
+    import subprocess
+
+    if shutil.which(args[0]) is None:
+        return f"{args[0]}: command not found"
+    try:
+        result = subprocess.run(args, capture_output=True, text=True)
+    except OSError as error:
+        return str(error)
+    return (result.stdout + result.stderr).rstrip("\n")
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _crontab_l():
+    return _run(["crontab", "-l"])
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cron_status():
+    return _run(["systemctl", "status", "cron"])
+
+
+def tail_grep(path, needle, n, block_size=64 * 1024):
+    """Returns the last `n` lines of `path` containing `needle`.
+
+    The file is read backwards in blocks from EOF, so only its tail is
+    touched instead of scanning the whole (possibly huge) log.
+    """
+    matches = []
+    with open(path, "rb") as f:
+        pos = f.seek(0, 2)
+        partial = b""
+        while pos > 0 and len(matches) < n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b"\n")
+            # first piece may be cut mid-line, keep it for the next block
+            partial = lines.pop(0)
+            for line in reversed(lines):
+                if needle in line:
+                    matches.append(line)
+                    if len(matches) == n:
+                        break
+        if pos == 0 and len(matches) < n and needle in partial:
+            matches.append(partial)
+    return [line.decode(errors="replace") for line in reversed(matches)]
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cron_logs(path="/var/log/syslog", n=10):
+    try:
+        return "\n".join(tail_grep(path, b"CRON", n))
+    except OSError as error:
+        return str(error)
+
+
+def _take_cron_snapshot():
+    st.session_state["cron_snapshot"] = (
+        datetime.now(), _crontab_l(), _cron_status(), _cron_logs())
+
+
+def _refresh_cron_snapshot():
+    """Refresh button callback: drops cached output and takes a new snapshot."""
+    _crontab_l.clear()
+    _cron_status.clear()
+    _cron_logs.clear()
+    _take_cron_snapshot()
+
+
 # Define tab structure
 tabs = st.tabs(["Intro", "Windows Automation", "Linux Automation", "Cron Status"])
 
@@ -77,17 +151,27 @@ with tabs[2]:
     """)
 
 # Tab 4: Cron Status - Live Monitoring
-with tabs[3]:
+@st.fragment
+def render_cron_status():
+    """Cron Status body; Refresh reruns only this fragment, not the whole app."""
     st.header("Current Cron Job Status")
 
+    # Only query cron on first view or on explicit request, not on every rerun
+    st.button("Refresh", on_click=_refresh_cron_snapshot)
+    if "cron_snapshot" not in st.session_state:
+        _take_cron_snapshot()
+    taken_at, cron_list, cron_status, cron_logs = st.session_state["cron_snapshot"]
+    st.caption(f"Last refreshed at {taken_at:%H:%M:%S}")
+
     st.subheader("Active Cron Jobs")
-    cron_list = subprocess.getoutput("crontab -l")
     st.code(cron_list, language="bash")
 
     st.subheader("Cron Service Status")
-    cron_status = subprocess.getoutput("systemctl status cron")
     st.code(cron_status, language="bash")
 
     st.subheader("Recent Cron Logs")
-    cron_logs = subprocess.getoutput("grep CRON /var/log/syslog | tail -n 10")
     st.code(cron_logs, language="bash")
+
+
+with tabs[3]:
+    render_cron_status()
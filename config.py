@@ -1,12 +1,120 @@
 # core/config.py
-import configparser
+import functools
+import logging
 import os
+import re
 from pathlib import Path
 
+try:
+    import tomllib  # Python 3.11+, parser em C
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None
+
+logger = logging.getLogger(__name__)
+
+# Parser mínimo de INI: o config.ini só tem a seção [security], então não
+# precisamos da interpolação/máquina de estados do configparser.
+SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$', re.M)
+KV_RE = re.compile(r'^([A-Za-z_][\w\-]*)\s*[=:]\s*(.*?)\s*$')
+
+
+def _section_items(body: str, section: str):
+    """Pares (chave, valor) do corpo de uma seção; ValueError em linha inválida."""
+    items = []
+    for line in body.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+        match = KV_RE.match(line)
+        if match is None:
+            raise ValueError(f"Linha inválida na seção [{section}]: {line!r}")
+        items.append((match.group(1), match.group(2).replace('%%', '%')))
+    return items
+
+
+def _read_section(text: str, section: str):
+    """Retorna os pares (chave, valor) da seção `section`, ou None se não existir.
+
+    Aceita `chave = valor` e `chave: valor`, ignora linhas em branco e
+    comentários (`#`/`;`) e troca `%%` por `%` como o configparser. Não há
+    interpolação `%(nome)s`. Qualquer outra linha gera ValueError. Como no
+    configparser, os valores de [DEFAULT] valem para a seção, que tem
+    precedência sobre eles.
+    """
+    headers = list(SECTION_RE.finditer(text))
+    bodies = {}
+    for idx, header in enumerate(headers):
+        name = header.group(1).strip()
+        if name in (section, 'DEFAULT'):
+            end = headers[idx + 1].start() if idx + 1 < len(headers) else len(text)
+            bodies[name] = text[header.end():end]
+    if section not in bodies:
+        return None
+    defaults = _section_items(bodies.get('DEFAULT', ''), 'DEFAULT')
+    return defaults + _section_items(bodies[section], section)
+
+
+def _read_toml_section(toml_path: str, section: str):
+    """Mesmo contrato de `_read_section`, lendo um arquivo TOML."""
+    if tomllib is None:
+        raise RuntimeError("Leitura de config.toml requer Python 3.11+ (tomllib)")
+    try:
+        with open(toml_path, 'rb') as f:
+            data = tomllib.load(f)
+    except OSError:
+        return None
+    table = data.get(section)
+    return list(table.items()) if isinstance(table, dict) else None
+
+
+def _default_config_path() -> Path:
+    """config.toml se existir (e houver tomllib), senão o config.ini legado."""
+    base = Path(__file__).parent
+    if tomllib is not None and (base / "config.toml").exists():
+        return base / "config.toml"
+    return base / "config.ini"
+
+
+def _read_settings(ini_path: str) -> dict:
+    """Lê a seção [security] e aplica as sobrescritas de ambiente."""
+    if ini_path.endswith('.toml'):
+        items = _read_toml_section(ini_path, 'security')
+    else:
+        try:
+            # codificação do sistema, como configparser.read()
+            text = Path(ini_path).read_text()
+        except OSError:
+            text = ''
+        except UnicodeDecodeError as error:
+            raise ValueError(f"Não foi possível decodificar {Path(ini_path).name}: "
+                             f"{error}") from error
+        items = _read_section(text, 'security')
+
+    if items is None:
+        raise ValueError(f"Seção [security] não encontrada em {Path(ini_path).name}")
+
+    # snapshot único do ambiente (nomes com o mesmo case de os.environ)
+    env = dict(os.environ)
+
+    resolved = {}
+    for key, val in items:
+        # transforma em atributo MAIÚSCULO (e identificador válido)
+        name = key.upper().replace('-', '_')
+        if not name.isidentifier():
+            raise ValueError(f"Chave inválida na seção [security] de "
+                             f"{Path(ini_path).name}: {key!r}")
+        # se existir VARIÁVEL_DE_AMBIENTE com mesmo nome, usa ela
+        resolved[name] = env.get(name, val)
+    return resolved
+
+
 class Settings:
     """
     A class to handle application settings loaded from a configuration file.
 
+    Attributes are resolved once in the constructor and are read-only
+    afterwards.
+
     How to use example:
     
         ```python
@@ -18,25 +126,31 @@ class Settings:
         ```
     """
     def __init__(self, ini_path: str):
-        parser = configparser.ConfigParser()
-        parser.read(ini_path)
+        self.__dict__.update(_read_settings(ini_path))
 
-        if 'security' not in parser:
-            raise ValueError("Seção [security] não encontrada em config.ini")
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Settings é somente leitura: {name}")
 
-        for key, val in parser['security'].items():
-            # transforma em atributo MAIÚSCULO
-            name = key.upper()
-            # se existir VARIÁVEL_DE_AMBIENTE com mesmo nome, usa ela
-            env = os.getenv(name)
-            setattr(self, name, env if env is not None else val)
+    def __delattr__(self, name):
+        raise AttributeError(f"Settings é somente leitura: {name}")
 
     def __repr__(self):
         attrs = ", ".join(f"{k}={v!r}" for k,v in self.__dict__.items())
         return f"<security {attrs}>"
 
+
+@functools.lru_cache(maxsize=1)
+def _load(ini_path: str) -> Settings:
+    """Lê o arquivo de configuração uma única vez por processo e por caminho."""
+    logger.debug("config base path: %s", ini_path)
+    return Settings(ini_path)
+
+
+def get_settings() -> Settings:
+    """Retorna a instância de Settings já carregada (cacheada)."""
+    return _load(str(config_path))
+
+
 # instancia única, importável por todo o app
-print(f"config base path: {Path(__file__).parent / 'config.ini'}")
-config_path = os.getenv("OPEN_SHEET_APP_CONFIG", Path(__file__).parent / "config.ini")
-_base = config_path
-settings = Settings(str(_base))
+config_path = os.getenv("OPEN_SHEET_APP_CONFIG") or _default_config_path()
+settings = get_settings()
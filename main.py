@@ -22,6 +22,8 @@ If the task starts with three exclamations (!) marks, it will not be synchronize
 %% $Copyright: Tapir Lab.$
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 """
+import logging
+import sys
 from datetime import datetime
 import synchronization as sync
 from config import settings as s
@@ -76,10 +78,8 @@ def main(parameters):
     credentials = sync.load_credentials(secret_file, scopes)
     # create calendar service
     calendar_service = sync.google_calendar_service(credentials)
-    # Read events from calendar
-    all_events = sync.read_events(calendar_service, calendar_id)
-    # Parse events
-    parsed_events, gc_err = sync.parse_events(all_events)
+    # Read events changed since the last run and merge them into the cache
+    parsed_events, gc_err = sync.read_parsed_events(calendar_service, calendar_id)
     # SYNCHRONIZE!
     wps, errors = sync.synchronize_wps(parsed_wps,
                                        parsed_events,
@@ -97,6 +97,9 @@ def main(parameters):
 
 
 if __name__ == "__main__":
+    # Synchronization messages go to stdout, where print() used to write them
+    # (synchronization.sh appends stdout to test.log)
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format='%(message)s')
 
     # Before synchronization, you have to add your service account to your
     # calendar and sheet as an editor. If you do not add your account as an editor
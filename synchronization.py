@@ -35,12 +35,35 @@ Known Issues:
     has been performed. Thus, the sheet should be cleaned periodically.
     6. All the tasks should be listed in one page on OpenProject.
 """
-import json
+import functools
+import hashlib
+import logging
+import pickle
+import re
 from datetime import datetime, timedelta
+from pathlib import Path
+import orjson
 import requests
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+# Google batch endpoint accepts at most 50 calls per HTTP request
+BATCH_SIZE = 50
+# Parsed events and the Calendar sync token of the previous run
+EVENTS_CACHE_FILE = Path(__file__).parent / 'events_cache.pkl'
+# Largest page size accepted by events().list, fewer pages to follow
+EVENTS_PAGE_SIZE = 2500
+# Only the fields `parse_events`/`read_events` use; keep in sync with them
+EVENT_FIELDS = ('nextPageToken,nextSyncToken,'
+                'items(id,status,summary,description,end,extendedProperties)')
+# Shared read-only fallback for missing nested objects; never mutate it
+_EMPTY = {}
+# Labelled lines written by `wp_to_event` into the event description
+_DESC_RE = re.compile(r'^[^\S\n]*(Assignee|UpdatedAt|DueHour):[^\S\n]*(.*?)[^\S\n]*$',
+                      re.M)
 
 # Allowed length of task name for OpenProject = 255
 # Allowed length of event name for Google Calendar = unknown.
@@ -49,7 +72,9 @@ from googleapiclient.discovery import build
 def get_projects_and_ids(session, url):
     """Reads projects from OpenProject and returns project names and ids"""
 
-    read_url = json.loads(session.get(url+"projects/").content.decode('utf-8'))
+    response = session.get(url+"projects/")
+    response.raise_for_status()
+    read_url = orjson.loads(response.content)
     raw_projects = read_url['_embedded']['elements']
     parsed_projects = {elem['name']:elem['id'] for elem in raw_projects}
 
@@ -82,7 +107,8 @@ def load_credentials(secret_file_path, scopes):
 def google_calendar_service(credentials):
     """Creates service for Google Calendar based on given credentials."""
     try:
-        service = build('calendar', 'v3', credentials=credentials)
+        service = build('calendar', 'v3', credentials=credentials,
+                        cache_discovery=False)
     except Exception as error:
         raise error
 
@@ -90,9 +116,10 @@ def google_calendar_service(credentials):
 
 
 def google_sheet_service(credentials):
-    """Creates service for Google Calendar based on given credentials."""
+    """Creates service for Google Sheets based on given credentials."""
     try:
-        service = build('sheets', 'v4', credentials=credentials)
+        service = build('sheets', 'v4', credentials=credentials,
+                        cache_discovery=False)
     except Exception as error:
         raise error
 
@@ -100,7 +127,12 @@ def google_sheet_service(credentials):
 
 
 def openproject_session(api_key):
-    """Create a session with given api key"""
+    """Create a session with given api key
+
+    The same session must be passed to every OpenProject call of a run
+    (`get_projects_and_ids`, `read_workpackages`) so they share its keep-alive
+    connections.
+    """
     session = requests.sessions.Session()  # Session to OpenProject
     session.auth = requests.auth.HTTPBasicAuth('apikey', api_key)  # Authorization
 
@@ -110,7 +142,9 @@ def openproject_session(api_key):
 def read_workpackages(session, url, project_id):
     """Reads work packages from OpenProject and return as json"""
     api_url = url + "projects/{}/work_packages".format(project_id)
-    workpackages = json.loads(session.get(api_url).content.decode('utf-8'))
+    response = session.get(api_url)
+    response.raise_for_status()
+    workpackages = orjson.loads(response.content)
 
     return workpackages
 
@@ -137,8 +171,9 @@ def parse_workpackages(workpackages):
 
     for elem in workpackages['_embedded']['elements']:
         # Ignorar WP cujo “raw” da descrição seja None ou comece com “!!!”
-        raw_desc = elem.get('description', {}).get('raw')
-        if raw_desc is None or raw_desc.split('\n')[0] == '!!!':
+        description = elem.get('description') or _EMPTY
+        raw_desc = description.get('raw')
+        if raw_desc is None or raw_desc.partition('\n')[0] == '!!!':
             continue
 
         try:
@@ -147,11 +182,13 @@ def parse_workpackages(workpackages):
             tmp['subject'] = elem.get('subject', '').strip()
 
             # Manter a descrição HTML (para aparecer no evento)
-            tmp['description'] = elem.get('description', {}).get('html', '')
+            tmp['description'] = description.get('html', '')
 
             # Parental relation: se existir, “parentId:title”; senão, “No parent”
-            parent_link = elem.get('_links', {}).get('parent', {}).get('href')
-            parent_title = elem.get('_links', {}).get('parent', {}).get('title')
+            links = elem.get('_links') or _EMPTY
+            parent = links.get('parent') or _EMPTY
+            parent_link = parent.get('href')
+            parent_title = parent.get('title')
             if parent_link and parent_title:
                 parent_id = parent_link.rstrip('/').split('/')[-1]
                 tmp['parent'] = f"{parent_id}:{parent_title}"
@@ -159,7 +196,7 @@ def parse_workpackages(workpackages):
                 tmp['parent'] = "No parent"
 
             # Assignee (pode não existir)
-            assignee_info = elem.get('_links', {}).get('assignee', {})
+            assignee_info = links.get('assignee') or _EMPTY
             tmp['assignee'] = assignee_info.get('title', 'Não designado a nenhuma pessoa')
 
             # due_date e due_hour:
@@ -193,21 +230,41 @@ def parse_workpackages(workpackages):
     return parsed_wps, err
 
 
-def read_events(service, calendar_id, time='2025-02-01T00:00:00Z'):
-    """Reads and returns all events on the calendar after the specified time
-    Bug: What happens if this function returns nothing and raises an exception?
+def read_events(service, calendar_id, time='2025-02-01T00:00:00Z', sync_token=None):
+    """Reads events on the calendar and the token for the next incremental read.
+
+    Without `sync_token`, all events after the specified time are listed.
+    With it, only events changed (including cancelled ones) since the token
+    was issued are returned. All result pages are followed.
+
+    Returns:
+        events: list of raw events
+        next_sync_token: token to pass on the next call
+
+    Raises:
+        HttpError: status 410 means the sync token expired; a full read is needed.
     """
-    try:
-        events_result = service.events().list(calendarId=calendar_id, timeMin=time).execute()
-        events = events_result.get('items', [])
-        return events
-    except Exception as error:
-        print(error)
+    if sync_token:
+        query = {'syncToken': sync_token}
+    else:
+        query = {'timeMin': time}
+
+    events, next_sync_token = [], None
+    request = service.events().list(calendarId=calendar_id, fields=EVENT_FIELDS,
+                                    maxResults=EVENTS_PAGE_SIZE, **query)
+    while request is not None:
+        response = request.execute()
+        events.extend(response.get('items', []))
+        next_sync_token = response.get('nextSyncToken', next_sync_token)
+        request = service.events().list_next(request, response)
+
+    return events, next_sync_token
 
-def parse_events(events):
-    """Parses events do Google Calendar de volta para a estrutura de `parsed_wps`.
 
-    Para cada evento, extrai:
+def parse_event(elem):
+    """Parses um evento do Google Calendar para a estrutura de `parsed_wps`.
+
+    Extrai:
       - event_id   (elem['id'])
       - wp_id      (inteiro extraído de summary antes de “:”)
       - subject    (tudo após “:” em summary)
@@ -215,76 +272,162 @@ def parse_events(events):
       - updated_at (buscando “UpdatedAt: …” na descrição)
       - due_date   (a parte “YYYY-MM-DD” de end.dateTime ou end.date)
       - due_hour   (a parte “HH:MM:SS” de end.dateTime, ou texto de “DueHour:” na descrição)
+      - content_hash (extendedProperties.private.contentHash, se houver)
+
+    Raises:
+        ValueError: se o summary não estiver no formato “<wp_id>:<subject>”.
+    """
+    tmp = {}
+    # 1) event_id
+    tmp['event_id'] = elem.get('id', '')
+
+    # 2) summary: “<wp_id>:<subject>” → separar apenas no primeiro “:”
+    summary = elem.get('summary', '') or ''
+    # Se summary não existir ou não tiver “:”, pular esse evento
+    if ':' not in summary:
+        raise ValueError(f"Summary inválido (espera ‘<id>:<texto>’): {summary}")
+    wp_id_str, _, subject = summary.partition(':')
+    try:
+        wp_id_int = int(wp_id_str.strip())
+    except Exception:
+        raise ValueError(f"WP ID não é inteiro: '{wp_id_str}'")
+    tmp['wp_id'] = wp_id_int
+    tmp['subject'] = subject.strip()
+
+    # 3) descrição: pode ser None ou string
+    raw_desc = elem.get('description', '') or ''
+
+    # Linhas rotuladas em uma única passada (None se ausentes);
+    # “Parent: …” é ignorado, pois não precisamos dele no parser
+    fields = dict(_DESC_RE.findall(raw_desc))
+    tmp['assignee'] = fields.get('Assignee')
+    tmp['updated_at'] = fields.get('UpdatedAt')
+    tmp['due_hour'] = fields.get('DueHour')
+
+    # hash do conteúdo gravado por `wp_to_event` (None em eventos antigos)
+    private = (elem.get('extendedProperties') or {}).get('private') or {}
+    tmp['content_hash'] = private.get('contentHash')
+
+    # 4) start/end: pegar de end → se houver `dateTime`, extrair date + time;
+    #    caso tenha só `date` (evento dia todo), colocar time “00:00:00”
+    end_info = elem.get('end', {})
+    if 'dateTime' in end_info and end_info['dateTime']:
+        # ex: “2025-07-17T14:00:00-03:00” (RFC3339, formato fixo)
+        end_dt = end_info['dateTime']
+        if len(end_dt) >= 19 and end_dt[10] == 'T':
+            end_date, end_time = end_dt[:10], end_dt[11:19]
+        else:
+            dt_obj = datetime.fromisoformat(end_dt.replace('Z', '+00:00'))
+            end_date = dt_obj.date().isoformat()
+            end_time = dt_obj.time().isoformat()
+        tmp['due_date'] = end_date
+        tmp['due_hour'] = tmp.get('due_hour') or end_time
+    elif 'date' in end_info and end_info['date']:
+        tmp['due_date'] = end_info['date']
+        # se não veio `dateTime`, manter due_hour já lido de “DueHour:” ou “00:00:00”
+        tmp['due_hour'] = tmp.get('due_hour') or "00:00:00"
+    else:
+        # campo end ausente ou inválido
+        tmp['due_date'] = None
+        if tmp.get('due_hour') is None:
+            tmp['due_hour'] = None
+
+    return tmp
+
+
+def parse_events(events):
+    """Parses events do Google Calendar de volta para a estrutura de `parsed_wps`.
+
+    Cada evento é processado por `parse_event`.
     Retorna:
       - parsed_events: dict[int_wp_id, dict_campos]
       - err: lista de [elem_original, Exception]
     """
-    from dateutil.parser import isoparse
-
     parsed_events = {}
     err = []
 
     for elem in events:
         try:
-            tmp = {}
-            # 1) event_id
-            tmp['event_id'] = elem.get('id', '')
-
-            # 2) summary: “<wp_id>:<subject>” → separar apenas no primeiro “:”
-            summary = elem.get('summary', '') or ''
-            # Se summary não existir ou não tiver “:”, pular esse evento
-            if ':' not in summary:
-                raise ValueError(f"Summary inválido (espera ‘<id>:<texto>’): {summary}")
-            wp_id_str, _, subject = summary.partition(':')
-            try:
-                wp_id_int = int(wp_id_str.strip())
-            except Exception:
-                raise ValueError(f"WP ID não é inteiro: '{wp_id_str}'")
-            tmp['wp_id'] = wp_id_int
-            tmp['subject'] = subject.strip()
-
-            # 3) descrição: pode ser None ou string
-            raw_desc = elem.get('description', '') or ''
-            lines = [ linha.strip() for linha in raw_desc.splitlines() if linha.strip() ]
-
-            # Inicializar valores default
-            tmp['assignee'] = None
-            tmp['updated_at'] = None
-            tmp['due_hour'] = None
+            tmp = parse_event(elem)
+            parsed_events[ tmp['wp_id'] ] = tmp
+        except Exception as error:
+            err.append([elem, error])
 
-            # Percorrer cada linha procurando prefixos conhecidos
-            for line in lines:
-                if line.startswith("Assignee:"):
-                    tmp['assignee'] = line.replace("Assignee:", "").strip()
-                elif line.startswith("UpdatedAt:"):
-                    tmp['updated_at'] = line.replace("UpdatedAt:", "").strip()
-                elif line.startswith("DueHour:"):
-                    tmp['due_hour'] = line.replace("DueHour:", "").strip()
-                # podemos ignorar “Parent: …” aqui, pois não precisamos dele no parser
-
-            # 4) start/end: pegar de end → se houver `dateTime`, extrair date + time;
-            #    caso tenha só `date` (evento dia todo), colocar time “00:00:00”
-            end_info = elem.get('end', {})
-            if 'dateTime' in end_info and end_info['dateTime']:
-                # ex: “2025-07-17T14:00:00-03:00”
-                dt_obj = isoparse(end_info['dateTime'])
-                tmp['due_date'] = dt_obj.date().isoformat()
-                tmp['due_hour'] = tmp.get('due_hour') or dt_obj.time().isoformat()
-            elif 'date' in end_info and end_info['date']:
-                tmp['due_date'] = end_info['date']
-                # se não veio `dateTime`, manter due_hour já lido de “DueHour:” ou “00:00:00”
-                tmp['due_hour'] = tmp.get('due_hour') or "00:00:00"
-            else:
-                # campo end ausente ou inválido
-                tmp['due_date'] = None
-                if tmp.get('due_hour') is None:
-                    tmp['due_hour'] = None
+    return parsed_events, err
+
+
+def load_events_cache(calendar_id, path=EVENTS_CACHE_FILE):
+    """Returns (sync_token, events_by_id) saved by the previous run, if any.
 
-            parsed_events[ wp_id_int ] = tmp
+    A missing or unreadable cache, or one written for another calendar,
+    gives (None, {}) so that every event is read again.
+    """
+    try:
+        with open(path, 'rb') as cache_file:
+            cache = pickle.load(cache_file)
+        if cache['calendar_id'] != calendar_id:
+            return None, {}
+        return cache['sync_token'], cache['events']
+    except (OSError, EOFError, KeyError, TypeError, pickle.UnpicklingError):
+        return None, {}
+
+
+def save_events_cache(calendar_id, sync_token, events_by_id, path=EVENTS_CACHE_FILE):
+    """Persists the sync token and parsed events (keyed by event id)."""
+    with open(path, 'wb') as cache_file:
+        pickle.dump({'calendar_id': calendar_id, 'sync_token': sync_token,
+                     'events': events_by_id}, cache_file)
+
+
+def read_parsed_events(service, calendar_id, cache_path=EVENTS_CACHE_FILE):
+    """Reads calendar events incrementally and returns them parsed.
+
+    Uses the Calendar `syncToken` protocol: only events changed since the
+    previous run are listed and parsed, then merged into the parsed events
+    cached on disk. The cache is keyed by event id, so when several events
+    carry the same wp_id, cancelling one of them keeps the others. If there
+    is no cache (or token) for `calendar_id`, or Google answers 410 GONE
+    because the token expired, every event is read again from scratch. The
+    cache is only saved when Google returns a new sync token; failing to
+    write it is logged and does not stop the sync.
 
+    Returns:
+        parsed_events: dict[int_wp_id, dict_campos], as in `parse_events`
+        err: list of [raw_event, Exception] for changed events
+    """
+    sync_token, events_by_id = load_events_cache(calendar_id, cache_path)
+    if not sync_token:
+        # full read: the cached events can not be trusted without a token
+        events_by_id = {}
+    try:
+        events, next_sync_token = read_events(service, calendar_id,
+                                              sync_token=sync_token)
+    except HttpError as error:
+        if not sync_token or error.resp.status != 410:
+            raise
+        sync_token, events_by_id = None, {}
+        events, next_sync_token = read_events(service, calendar_id)
+
+    # Drop every changed or cancelled event, then re-add the ones that still
+    # exist with their new content
+    err = []
+    for elem in events:
+        events_by_id.pop(elem.get('id'), None)
+        if elem.get('status') == 'cancelled':
+            continue
+        try:
+            events_by_id[elem.get('id')] = parse_event(elem)
         except Exception as error:
             err.append([elem, error])
 
+    # Without a token the next run has to do a full read anyway
+    if next_sync_token:
+        try:
+            save_events_cache(calendar_id, next_sync_token, events_by_id, cache_path)
+        except OSError as error:
+            logger.warning('Could not save events cache %s: %s', cache_path, error)
+
+    parsed_events = {event['wp_id']: event for event in events_by_id.values()}
     return parsed_events, err
 
 
@@ -297,14 +440,13 @@ def wp_to_event(work_package):
       - start: data/hora vindos de due_date + due_hour
       - end: uma hora depois de start
       - reminders padrão
+      - extendedProperties.private.contentHash: hash do conteúdo visível,
+        sem o UpdatedAt, usado por `may_update` para pular updates inócuos
     """
-    from datetime import timedelta
-
     wp = work_package
 
-    # Converte “YYYY-MM-DD” + “HH:MM:SS” em datetime UTC-local
-    event_start = str_to_date(wp['due_date'], wp['due_hour'])
-    event_finish = event_start + timedelta(hours=1)
+    # “YYYY-MM-DD” + “HH:MM:SS” → início/fim em ISO com fuso local
+    start_iso, end_iso = event_times(wp['due_date'], wp['due_hour'])
 
     # Montar descrição com rótulos explícitos
     # - Descrição original já está em HTML (ou vazio)
@@ -314,19 +456,26 @@ def wp_to_event(work_package):
     updated = wp.get('updated_at', '')
     # Opcional: incluir o próprio HTML separado por linha em texto plano, 
     # ou mantê-lo como está. Aqui mantemos “raw HTML” + rótulos
-    description = (
-        f"{desc_html}\n"
-        f"Parent: {parent}\n"
-        f"Assignee: {assignee}\n"
-        f"UpdatedAt: {updated}\n"
-        f"DueHour: {wp.get('due_hour', '')}"
-    )
+    due_hour = wp.get('due_hour', '')
+    description = "\n".join((
+        desc_html,
+        "Parent: " + parent,
+        "Assignee: " + assignee,
+        "UpdatedAt: " + updated,
+        "DueHour: " + due_hour,
+    ))
+
+    summary = str(wp['wp_id']) + ':' + wp['subject']
+    content = orjson.dumps([summary, desc_html, parent, assignee,
+                            due_hour, start_iso, end_iso])
+    content_hash = hashlib.blake2b(content, digest_size=8).hexdigest()
 
     event = {
-        'summary': f"{wp['wp_id']}:{wp['subject']}",
+        'summary': summary,
         'description': description,
-        'start': {'dateTime': event_start.astimezone().isoformat()},
-        'end':   {'dateTime': event_finish.astimezone().isoformat()},
+        'start': {'dateTime': start_iso},
+        'end':   {'dateTime': end_iso},
+        'extendedProperties': {'private': {'contentHash': content_hash}},
         'reminders': {
             'useDefault': False,
             'overrides': [
@@ -338,8 +487,26 @@ def wp_to_event(work_package):
     return event
 
 
+@functools.lru_cache(maxsize=1024)
+def event_times(due_date, due_hour):
+    """Returns ISO start and end (one hour later) of an event, in local time.
+
+    Many work packages share the same due date and hour, so results are cached.
+    """
+    event_start = str_to_date(due_date, due_hour)
+    event_finish = event_start + timedelta(hours=1)
+    return event_start.astimezone().isoformat(), event_finish.astimezone().isoformat()
+
+
 
 def str_to_date(due_date: str, due_hour: str) -> datetime:
+    # Caminho rápido para o formato usual “YYYY-MM-DD” + “HH:MM:SS[.fff]”
+    if (len(due_date) == 10 and due_date[4] == '-' and due_date[7] == '-'
+            and due_hour and len(due_hour) >= 8 and due_hour[2] == ':'
+            and due_hour[5] == ':' and (len(due_hour) == 8 or due_hour[8] == '.')):
+        return datetime(int(due_date[0:4]), int(due_date[5:7]), int(due_date[8:10]),
+                        int(due_hour[0:2]), int(due_hour[3:5]), int(float(due_hour[6:])))
+
     date_parts = [int(part) for part in due_date.split('-')]
 
     if due_hour:
@@ -375,19 +542,11 @@ def to_create(work_package, service, calendar_id):
         calendar_id: Calendar ID of Google Calendar
 
     Returns:
-        str(e): If an error occurs during the process, it will be returned.
-
-    ToDo: Return a value for success insted of printing
+        request: Unexecuted insert request, to be added to a batch.
     """
     wp = work_package
     event = wp_to_event(wp)
-    try:
-        response = service.events().insert(calendarId=calendar_id,
-                                           body=event).execute()
-        print('Event %s created at: %s' %(event['summary'],
-                                          response.get('htmlLink')))
-    except Exception as error:
-        return str(error)
+    return service.events().insert(calendarId=calendar_id, body=event)
 
 
 def to_delete(parsed_event, service, calendar_id):
@@ -405,18 +564,10 @@ def to_delete(parsed_event, service, calendar_id):
         calendar_id: Calendar ID of Google Calendar
 
     Returns:
-        str(e): If an error occurs during the process, it will be returned.
-
-    ToDo: Return a value for success insted of printing
+        request: Unexecuted delete request, to be added to a batch.
     """
     event_id = parsed_event['event_id']
-    subject = parsed_event['subject']
-    try:
-        service.events().delete(calendarId=calendar_id,
-                                eventId=event_id).execute()
-        print('Work Package: {} has been deleted'.format(subject))
-    except Exception as error:
-        return str(error)
+    return service.events().delete(calendarId=calendar_id, eventId=event_id)
 
 
 def may_update(work_package, parsed_event, service, calendar_id):
@@ -435,21 +586,48 @@ def may_update(work_package, parsed_event, service, calendar_id):
         calendar_id: Calendar ID of Google Calendar
 
     Returns:
-        str(e): If an error occurs during the process, it will be returned.
-
-    ToDo: Return a value for success insted of printing
+        request: Unexecuted update request to be added to a batch, or None
+        if the event is already up to date. A work package whose updatedAt
+        changed but whose event content did not (same content hash) is
+        considered up to date.
     """
     wp = work_package
     if wp['updated_at'] != parsed_event['updated_at']:
         tmp = wp_to_event(wp)
+        content_hash = tmp['extendedProperties']['private']['contentHash']
+        if content_hash == parsed_event.get('content_hash'):
+            return None
         event_id = parsed_event['event_id']
+        return service.events().update(calendarId=calendar_id,
+                                       eventId=event_id,
+                                       body=tmp)
+    return None
+
+
+def execute_in_batches(service, requests_by_id, callback):
+    """Executes Google API requests in batches of at most BATCH_SIZE calls.
+
+    Each batch is sent as a single HTTP round-trip. `callback` is called once
+    per request as callback(request_id, response, exception) where
+    request_id is the string form of the given id. If a whole batch fails,
+    the callback receives that error for each request of the batch.
+
+    Args:
+        service: Google API service the requests were built with
+        requests_by_id: iterable of (id, request) pairs
+        callback: function called with the result of each request
+    """
+    pending = list(requests_by_id)
+    for start in range(0, len(pending), BATCH_SIZE):
+        chunk = pending[start:start + BATCH_SIZE]
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id, request in chunk:
+            batch.add(request, request_id=str(request_id))
         try:
-            updated_event = service.events().update(calendarId=calendar_id,
-                                                    eventId=event_id,
-                                                    body=tmp).execute()
-            print('Event %s has been updated' % updated_event['summary'])
+            batch.execute()
         except Exception as error:
-            return str(error)
+            for request_id, _ in chunk:
+                callback(str(request_id), None, error)
 
 
 def synchronize_wps(parsed_wps, parsed_events, service, calendar_id):
@@ -469,29 +647,62 @@ def synchronize_wps(parsed_wps, parsed_events, service, calendar_id):
 
     Returns:
         wp_ids: classified wp_ids as create, delete or update
-        err: Faced errors during creation, deletion or update
+        err: Faced errors during creation, deletion or update, as lists of
+        (wp_id, error message) pairs. Successful operations are not listed.
     """
-    wps_on_openproject = set(parsed_wps.keys())
-    wps_on_calendar = set(parsed_events.keys())
+    # dict.keys() views already support set operations, no copies needed
+    wps_on_openproject = parsed_wps.keys()
+    wps_on_calendar = parsed_events.keys()
     # Decide which packages to create, to delete and may update
-    to_create_set = wps_on_openproject.difference(wps_on_calendar)
-    to_delete_set = wps_on_calendar.difference(wps_on_openproject)
-    may_update_set = wps_on_calendar.intersection(wps_on_openproject)
+    to_create_set = wps_on_openproject - wps_on_calendar
+    to_delete_set = wps_on_calendar - wps_on_openproject
+    may_update_set = wps_on_openproject & wps_on_calendar
     to_create_err, to_delete_err, may_update_err = [], [], []
 
-    # Iterate over each work_package
+    def on_created(request_id, response, exception):
+        if exception is None:
+            logger.info('Event %s created at: %s', response.get('summary'),
+                        response.get('htmlLink'))
+        else:
+            to_create_err.append((int(request_id), str(exception)))
+
+    def on_deleted(request_id, response, exception):
+        if exception is None:
+            subject = parsed_events[int(request_id)]['subject']
+            logger.info('Work Package: %s has been deleted', subject)
+        else:
+            to_delete_err.append((int(request_id), str(exception)))
+
+    def on_updated(request_id, response, exception):
+        if exception is None:
+            logger.info('Event %s has been updated', response.get('summary'))
+        else:
+            may_update_err.append((int(request_id), str(exception)))
+
+    # Build one request per work package and send them in batches
+    creates = []
     for wp_id in to_create_set:
-        err = to_create(parsed_wps[wp_id], service, calendar_id)
-        to_create_err.append(err)
+        try:
+            creates.append((wp_id, to_create(parsed_wps[wp_id], service, calendar_id)))
+        except Exception as error:
+            to_create_err.append((wp_id, str(error)))
+    execute_in_batches(service, creates, on_created)
 
-    for wp_id in to_delete_set:
-        err = to_delete(parsed_events[wp_id], service, calendar_id)
-        to_delete_err.append(err)
+    deletes = [(wp_id, to_delete(parsed_events[wp_id], service, calendar_id))
+               for wp_id in to_delete_set]
+    execute_in_batches(service, deletes, on_deleted)
 
+    updates = []
     for wp_id in may_update_set:
         work_package, event = parsed_wps[wp_id], parsed_events[wp_id]
-        err = may_update(work_package, event, service, calendar_id)
-        may_update_err.append(err)
+        try:
+            request = may_update(work_package, event, service, calendar_id)
+        except Exception as error:
+            may_update_err.append((wp_id, str(error)))
+            continue
+        if request is not None:
+            updates.append((wp_id, request))
+    execute_in_batches(service, updates, on_updated)
 
     wp_ids = [to_create_set, to_delete_set, may_update_set]
     error = [to_create_err, to_delete_err, may_update_err]
@@ -508,20 +719,20 @@ def save_logs(wps, errors, sheet_service, sheet_id):
 
     Args:
         wps: a dictionary of ids of structured workpackages.
-        errors: raised errors from calendar operations. If no error Nonetype
+        errors: (wp_id, error message) pairs of failed calendar operations
         sheet_service: Authorized Google Sheet API service
         sheet_id: Id of the sheet in which logs are saved.
     """
     # Error logs
     range_name = 'errors!A1'
     # Parse errors and insert where the error occured
-    to_create_errors = [str(elem) for elem in errors[0]]
+    to_create_errors = ['%s: %s' % elem for elem in errors[0]]
     to_create_errors.insert(0, 'to_create_errors')
 
-    to_delete_errors = [str(elem) for elem in errors[1]]
+    to_delete_errors = ['%s: %s' % elem for elem in errors[1]]
     to_delete_errors.insert(0, 'to_delete_errors')
 
-    may_update_errors = [str(elem) for elem in errors[2]]
+    may_update_errors = ['%s: %s' % elem for elem in errors[2]]
     may_update_errors.insert(0, 'may_update_errors')
 
     log_time = [datetime.now().isoformat()]
@@ -529,10 +740,9 @@ def save_logs(wps, errors, sheet_service, sheet_id):
     data = {'values': values}
 
     # Append into errors page of sheet
-    sheet_service.spreadsheets().values().append(spreadsheetId=sheet_id,
-                                                 valueInputOption='USER_ENTERED',
-                                                 range=range_name,
-                                                 body=data).execute()
+    append_errors = sheet_service.spreadsheets().values().append(
+        spreadsheetId=sheet_id, valueInputOption='USER_ENTERED',
+        range=range_name, body=data)
 
     # Parse actions and insert where the action has taken
     range_name = 'actions'
@@ -549,7 +759,19 @@ def save_logs(wps, errors, sheet_service, sheet_id):
     data = {'values': values,}
 
     # Append into actions page of sheet
-    sheet_service.spreadsheets().values().append(spreadsheetId=sheet_id,
-                                                 valueInputOption='USER_ENTERED',
-                                                 range=range_name,
-                                                 body=data).execute()
+    append_actions = sheet_service.spreadsheets().values().append(
+        spreadsheetId=sheet_id, valueInputOption='USER_ENTERED',
+        range=range_name, body=data)
+
+    failures = []
+
+    def collect_errors(request_id, response, exception):
+        if exception is not None:
+            failures.append(exception)
+
+    # Both appends travel in a single HTTP round-trip
+    execute_in_batches(sheet_service,
+                       [('errors', append_errors), ('actions', append_actions)],
+                       collect_errors)
+    if failures:
+        raise failures[0]